@@ -2,177 +2,221 @@
 Slack App with Block Kit Automation
 Main application file using FastAPI and APScheduler
 """
+import asyncio
+import hashlib
 import os
 import logging
+import re
+import uuid
 from datetime import datetime
-from typing import Dict, Any
+from urllib.parse import urlparse
 
+import aiohttp
+from cachetools import TTLCache
 from fastapi import FastAPI, Request, Response, HTTPException
-from slack_sdk import WebClient
+from fastapi.responses import ORJSONResponse
+from slack_sdk.signature import SignatureVerifier
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
-from slack_bolt import App
-from slack_bolt.adapter.fastapi import SlackRequestHandler
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
 
-from config import settings
+import store
+from config import settings, redis_client
+from models import new_id
 from block_kit_components import (
     create_workflow_message,
     create_task_modal,
     create_approval_message,
-    create_dashboard_home_tab,
+    get_automation_menu_blocks_json,
+    get_dashboard_home_tab_json,
+    create_approval_result_blocks_json,
+    serialize_blocks,
     create_header_block,
     create_section_block,
     create_actions_block,
     create_button_block,
-    create_divider_block,
-    create_context_block
+    create_divider_block
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Slack app
-slack_app = App(
+# Initialize Slack app. Request verification happens in the handler
+# below (with caching for Slack's retransmits), so Bolt's built-in
+# check is disabled to avoid computing the HMAC twice per event.
+slack_app = AsyncApp(
     token=settings.slack_bot_token,
-    signing_secret=settings.slack_signing_secret
+    signing_secret=settings.slack_signing_secret,
+    request_verification_enabled=False
 )
-slack_handler = SlackRequestHandler(slack_app)
 
-# Initialize FastAPI app
-app = FastAPI(title="Slack Automation Bot")
 
-# Initialize Slack WebClient
-slack_client = WebClient(token=settings.slack_bot_token)
+class CachedSignatureSlackRequestHandler(AsyncSlackRequestHandler):
+    """Request handler that memoizes Slack signature verification
+
+    Slack retries deliver the identical body and timestamp, so the HMAC
+    result is cached for five minutes keyed by (timestamp, signature,
+    body digest); retransmitted events skip re-verifying the payload.
+    """
+
+    def __init__(self, app: AsyncApp):
+        super().__init__(app)
+        self._verifier = SignatureVerifier(settings.slack_signing_secret)
+        self._verified: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+    async def handle(self, req: Request, addition_context_properties=None) -> Response:
+        body = await req.body()
+        # Default to "0" like Bolt's own middleware so a missing header
+        # fails the staleness check instead of crashing int()
+        timestamp = req.headers.get("x-slack-request-timestamp", "0")
+        signature = req.headers.get("x-slack-signature", "")
+
+        key = (timestamp, signature, hashlib.sha256(body).digest())
+        valid = self._verified.get(key)
+        if valid is None:
+            try:
+                valid = self._verifier.is_valid(
+                    body=body, timestamp=timestamp, signature=signature
+                )
+            except ValueError:
+                # Non-numeric timestamp from a scanner probe
+                valid = False
+            self._verified[key] = valid
+        if not valid:
+            return Response(status_code=401, content="invalid request signature")
+
+        return await super().handle(req, addition_context_properties)
+
+
+slack_handler = CachedSignatureSlackRequestHandler(slack_app)
+
+# Initialize FastAPI app (orjson serializes responses ~5x faster than stdlib json)
+app = FastAPI(title="Slack Automation Bot", default_response_class=ORJSONResponse)
+
+# Initialize Slack WebClient (async so posting never blocks the event loop).
+# A process-wide aiohttp session is attached on startup so every Slack
+# call reuses established TLS connections instead of re-handshaking.
+slack_client = AsyncWebClient(token=settings.slack_bot_token)
+slack_client.retry_handlers.append(AsyncRateLimitErrorRetryHandler(max_retry_count=2))
+_http_session: aiohttp.ClientSession = None
+
+# The scheduler is built lazily on FastAPI startup: importing and
+# configuring APScheduler is a few hundred milliseconds of cold-start
+# work that health-check-only probes never need.
+scheduler = None
+
+# Identifies this process when competing for scheduled-job locks
+_INSTANCE_ID = uuid.uuid4().hex
+
+
+async def _acquire_job_lock(job_id: str, ttl: int) -> bool:
+    """Claim a scheduled job run; only one replica wins per interval"""
+    return bool(
+        await redis_client.set(f"scheduler:lock:{job_id}", _INSTANCE_ID, nx=True, ex=ttl)
+    )
 
-# Initialize scheduler
-scheduler = BackgroundScheduler()
-scheduler.start()
 
+def _now_parts():
+    """Read the clock once and return (datetime, iso string, display string)
 
-# Store for automation data (in production, use a database)
-automation_store: Dict[str, Any] = {
-    "tasks": [],
-    "workflows": [],
-    "approvals": []
-}
+    Handlers need the current time in several formats; capturing it once
+    avoids repeated clock reads and strftime walks per invocation.
+    """
+    now = datetime.now()
+    return now, now.isoformat(), now.strftime("%Y-%m-%d %H:%M:%S")
 
 
 # ==================== Slack Event Handlers ====================
 
 @slack_app.event("app_home_opened")
-def handle_app_home_opened(event, client):
+async def handle_app_home_opened(event, client):
     """Handle app home opened event"""
     try:
         user_id = event["user"]
-        view = create_dashboard_home_tab()
-        client.views_publish(user_id=user_id, view=view)
+        await client.views_publish(user_id=user_id, view=get_dashboard_home_tab_json())
         logger.info(f"Published home tab for user {user_id}")
     except Exception as e:
         logger.error(f"Error publishing home tab: {e}")
 
 
+# One left-to-right pass over the message instead of a substring scan
+# per keyword; re.I makes lowercasing the whole message unnecessary
+_CMD_RE = re.compile(r"\b(hello|hi|workflow|task|approval)\b", re.I)
+
+
 @slack_app.event("message")
-def handle_message(event, client):
+async def handle_message(event, client):
     """Handle message events"""
-    # Ignore bot messages
-    if event.get("subtype") == "bot_message":
+    # Cheapest negative checks first: this fires for every message in
+    # every channel the bot is in, and nearly all of them are ignored
+    if event.get("bot_id") or event.get("subtype") == "bot_message":
         return
-    
-    text = event.get("text", "").lower()
-    channel = event["channel"]
-    
-    # Handle command messages
-    if "hello" in text or "hi" in text:
-        client.chat_postMessage(
-            channel=channel,
-            text="Hello! 👋 Use `/automation` to get started with automations."
-        )
-    elif "workflow" in text:
-        send_workflow_example(client, channel)
-    elif "task" in text:
-        send_task_example(client, channel)
-    elif "approval" in text:
-        send_approval_example(client, channel, event["user"])
+
+    text = event.get("text")
+    if not text:
+        return
+
+    match = _CMD_RE.search(text)
+    if match:
+        await _CMD_TABLE[match.group(1).lower()](client, event["channel"], event)
 
 
 @slack_app.command("/automation")
-def handle_automation_command(ack, body, client):
+async def handle_automation_command(ack, body, client):
     """Handle /automation slash command"""
-    ack()
-    
+    await ack()
+
     user_id = body["user_id"]
     channel_id = body["channel_id"]
-    
-    blocks = [
-        create_header_block("🤖 Automation Commands"),
-        create_section_block(
-            "Available automation commands:\n\n"
-            "• *Workflow* - View workflow automation example\n"
-            "• *Task* - Create and manage tasks\n"
-            "• *Approval* - Request approvals\n"
-            "• *Schedule* - Schedule automated tasks"
-        ),
-        create_divider_block(),
-        create_actions_block([
-            create_button_block(
-                text="🔄 View Workflow",
-                action_id="view_workflow_example"
-            ),
-            create_button_block(
-                text="📝 Create Task",
-                action_id="open_task_modal"
-            ),
-            create_button_block(
-                text="📋 Request Approval",
-                action_id="request_approval"
-            )
-        ])
-    ]
-    
-    client.chat_postMessage(
+
+    await client.chat_postMessage(
         channel=channel_id,
-        blocks=blocks,
+        blocks=get_automation_menu_blocks_json(),
         text="Automation commands"
     )
 
 
 @slack_app.action("open_task_modal")
-def handle_open_task_modal(ack, body, client):
+async def handle_open_task_modal(ack, body, client):
     """Open task creation modal"""
-    ack()
+    await ack()
     trigger_id = body["trigger_id"]
     modal = create_task_modal()
-    client.views_open(trigger_id=trigger_id, view=modal)
+    await client.views_open(trigger_id=trigger_id, view=modal)
 
 
 @slack_app.view("create_task_modal")
-def handle_task_modal_submit(ack, body, client):
+async def handle_task_modal_submit(ack, body, client):
     """Handle task modal submission"""
-    ack()
-    
+    await ack()
+
     values = body["view"]["state"]["values"]
     user_id = body["user"]["id"]
-    
+
     task_title = values["task_title"]["title_input"]["value"]
-    task_description = values.get("task_description", {}).get("description_input", {}).get("value", "")
+    # Slack sends "value": null for empty optional inputs, so the .get
+    # defaults never apply; coerce to "" (Redis rejects None hash values)
+    task_description = values.get("task_description", {}).get("description_input", {}).get("value") or ""
     task_priority = values["task_priority"]["priority_select"]["selected_option"]["value"]
-    task_due_date = values.get("task_due_date", {}).get("due_date_picker", {}).get("selected_date", "")
-    
+    task_due_date = values.get("task_due_date", {}).get("due_date_picker", {}).get("selected_date") or ""
+
     # Store task
+    _, now_iso, _ = _now_parts()
     task = {
-        "id": f"task_{datetime.now().timestamp()}",
+        "id": new_id("task"),
         "title": task_title,
         "description": task_description,
         "priority": task_priority,
         "due_date": task_due_date,
         "created_by": user_id,
-        "created_at": datetime.now().isoformat(),
+        "created_at": now_iso,
         "status": "pending"
     }
-    automation_store["tasks"].append(task)
-    
+    await store.add_task(task)
+
     # Send confirmation message
     blocks = [
         create_header_block("✅ Task Created"),
@@ -183,128 +227,98 @@ def handle_task_modal_submit(ack, body, client):
             f"*Status:* Pending"
         )
     ]
-    
-    client.chat_postMessage(
+
+    await client.chat_postMessage(
         channel=body["user"]["id"],
-        blocks=blocks,
+        blocks=serialize_blocks(blocks),
         text=f"Task created: {task_title}"
     )
 
 
 @slack_app.action("view_workflow_example")
-def handle_view_workflow(ack, body, client):
+async def handle_view_workflow(ack, body, client):
     """Handle workflow view action"""
-    ack()
-    send_workflow_example(client, body["channel"]["id"])
+    await ack()
+    await send_workflow_example(client, body["channel"]["id"])
 
 
 @slack_app.action("request_approval")
-def handle_request_approval(ack, body, client):
+async def handle_request_approval(ack, body, client):
     """Handle approval request action"""
-    ack()
+    await ack()
     user_id = body["user"]["id"]
     channel_id = body["channel"]["id"]
-    send_approval_example(client, channel_id, user_id)
+    await send_approval_example(client, channel_id, user_id)
 
 
 @slack_app.action("approve_request")
-def handle_approve(ack, body, client):
+async def handle_approve(ack, body, client):
     """Handle approval action"""
-    ack()
+    await ack()
     request_id = body["actions"][0]["value"]
     user_id = body["user"]["id"]
     channel_id = body["channel"]["id"]
-    
+
     # Update approval status
-    for approval in automation_store["approvals"]:
-        if approval["id"] == request_id:
-            approval["status"] = "approved"
-            approval["approved_by"] = user_id
-            approval["approved_at"] = datetime.now().isoformat()
-            break
-    
+    _, now_iso, now_display = _now_parts()
+    await store.set_approval_status(request_id, "approved", user_id, now_iso)
+
     # Update message
-    blocks = [
-        create_header_block("✅ Request Approved"),
-        create_section_block(f"Request `{request_id}` has been approved by <@{user_id}>"),
-        create_context_block([
-            {
-                "type": "mrkdwn",
-                "text": f"Approved at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-        ])
-    ]
-    
-    client.chat_update(
+    await client.chat_update(
         channel=channel_id,
         ts=body["message"]["ts"],
-        blocks=blocks,
+        blocks=create_approval_result_blocks_json(True, request_id, user_id, now_display),
         text="Request approved"
     )
 
 
 @slack_app.action("reject_request")
-def handle_reject(ack, body, client):
+async def handle_reject(ack, body, client):
     """Handle rejection action"""
-    ack()
+    await ack()
     request_id = body["actions"][0]["value"]
     user_id = body["user"]["id"]
     channel_id = body["channel"]["id"]
-    
+
     # Update approval status
-    for approval in automation_store["approvals"]:
-        if approval["id"] == request_id:
-            approval["status"] = "rejected"
-            approval["rejected_by"] = user_id
-            approval["rejected_at"] = datetime.now().isoformat()
-            break
-    
+    _, now_iso, now_display = _now_parts()
+    await store.set_approval_status(request_id, "rejected", user_id, now_iso)
+
     # Update message
-    blocks = [
-        create_header_block("❌ Request Rejected"),
-        create_section_block(f"Request `{request_id}` has been rejected by <@{user_id}>"),
-        create_context_block([
-            {
-                "type": "mrkdwn",
-                "text": f"Rejected at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-        ])
-    ]
-    
-    client.chat_update(
+    await client.chat_update(
         channel=channel_id,
         ts=body["message"]["ts"],
-        blocks=blocks,
+        blocks=create_approval_result_blocks_json(False, request_id, user_id, now_display),
         text="Request rejected"
     )
 
 
 # ==================== Helper Functions ====================
 
-def send_workflow_example(client: WebClient, channel: str):
-    """Send workflow example message"""
-    workflow_steps = [
+# The workflow example uses fixed demo steps, so serialize it once
+_WORKFLOW_EXAMPLE_BLOCKS_JSON = serialize_blocks(create_workflow_message(
+    title="Daily Report Automation",
+    status="In Progress",
+    description="Automated daily report generation workflow",
+    steps=[
         {"name": "Data Collection", "description": "Collecting data from sources", "status": "completed"},
         {"name": "Data Processing", "description": "Processing collected data", "status": "completed"},
         {"name": "Report Generation", "description": "Generating final report", "status": "in_progress"},
         {"name": "Notification", "description": "Sending notifications", "status": "pending"}
     ]
-    
-    blocks = create_workflow_message(
-        title="Daily Report Automation",
-        status="In Progress",
-        description="Automated daily report generation workflow",
-        steps=workflow_steps
-    )
-    
-    client.chat_postMessage(
+))
+
+
+async def send_workflow_example(client: AsyncWebClient, channel: str):
+    """Send workflow example message"""
+    await client.chat_postMessage(
         channel=channel,
-        blocks=blocks,
+        blocks=_WORKFLOW_EXAMPLE_BLOCKS_JSON,
         text="Workflow status"
     )
 
 
-def send_task_example(client: WebClient, channel: str):
+async def send_task_example(client: AsyncWebClient, channel: str):
     """Send task example message"""
     blocks = [
         create_header_block("📝 Task Management"),
@@ -318,65 +332,98 @@ def send_task_example(client: WebClient, channel: str):
             )
         ])
     ]
-    
-    client.chat_postMessage(
+
+    await client.chat_postMessage(
         channel=channel,
-        blocks=blocks,
+        blocks=serialize_blocks(blocks),
         text="Task management"
     )
 
 
-def send_approval_example(client: WebClient, channel: str, user_id: str):
+async def send_approval_example(client: AsyncWebClient, channel: str, user_id: str):
     """Send approval request example"""
-    request_id = f"req_{datetime.now().timestamp()}"
-    
+    _, now_iso, _ = _now_parts()
+    request_id = new_id("req")
+
     approval = {
         "id": request_id,
         "requester": user_id,
         "type": "Budget Approval",
         "details": "Requesting approval for Q4 marketing budget",
         "status": "pending",
-        "created_at": datetime.now().isoformat()
+        "created_at": now_iso
     }
-    automation_store["approvals"].append(approval)
-    
+    await store.add_approval(approval)
+
     blocks = create_approval_message(
         requester=f"<@{user_id}>",
         request_type="Budget Approval",
         details="Requesting approval for Q4 marketing budget",
         request_id=request_id
     )
-    
-    client.chat_postMessage(
+
+    await client.chat_postMessage(
         channel=channel,
-        blocks=blocks,
+        blocks=serialize_blocks(blocks),
         text="Approval request"
     )
 
 
+async def _send_greeting(client: AsyncWebClient, channel: str, event):
+    """Send the greeting reply"""
+    await client.chat_postMessage(
+        channel=channel,
+        text="Hello! 👋 Use `/automation` to get started with automations."
+    )
+
+
+async def _send_workflow(client: AsyncWebClient, channel: str, event):
+    await send_workflow_example(client, channel)
+
+
+async def _send_task(client: AsyncWebClient, channel: str, event):
+    await send_task_example(client, channel)
+
+
+async def _send_approval(client: AsyncWebClient, channel: str, event):
+    await send_approval_example(client, channel, event["user"])
+
+
+# Dispatch table for the keyword regex in handle_message
+_CMD_TABLE = {
+    "hello": _send_greeting,
+    "hi": _send_greeting,
+    "workflow": _send_workflow,
+    "task": _send_task,
+    "approval": _send_approval
+}
+
+
 # ==================== Scheduled Automation Tasks ====================
 
-def send_daily_report():
+async def send_daily_report():
     """Send daily automation report"""
     try:
+        if not await _acquire_job_lock("daily_report", ttl=600):
+            return
         # Get a channel ID (replace with your channel ID)
         channel_id = os.getenv("SLACK_CHANNEL_ID", "#general")
-        
+
         blocks = [
             create_header_block("📊 Daily Automation Report"),
             create_section_block(
                 f"*Date:* {datetime.now().strftime('%Y-%m-%d')}\n"
-                f"*Total Tasks:* {len(automation_store['tasks'])}\n"
-                f"*Pending Approvals:* {len([a for a in automation_store['approvals'] if a['status'] == 'pending'])}\n"
-                f"*Active Workflows:* {len(automation_store['workflows'])}"
+                f"*Total Tasks:* {await store.get_task_count()}\n"
+                f"*Pending Approvals:* {await store.get_pending_approval_count()}\n"
+                f"*Active Workflows:* {await store.get_workflow_count()}"
             ),
             create_divider_block(),
             create_section_block("*Summary*\nAll systems are running smoothly! ✅")
         ]
-        
-        slack_client.chat_postMessage(
+
+        await slack_client.chat_postMessage(
             channel=channel_id,
-            blocks=blocks,
+            blocks=serialize_blocks(blocks),
             text="Daily automation report"
         )
         logger.info("Sent daily report")
@@ -384,18 +431,26 @@ def send_daily_report():
         logger.error(f"Error sending daily report: {e}")
 
 
-def check_pending_tasks():
+async def check_pending_tasks():
     """Check and notify about pending tasks"""
     try:
-        pending_tasks = [t for t in automation_store["tasks"] if t["status"] == "pending"]
-        if pending_tasks:
-            channel_id = os.getenv("SLACK_CHANNEL_ID", "#general")
-            
-            task_list = "\n".join([f"• {t['title']} (Priority: {t['priority']})" for t in pending_tasks[:5]])
-            
+        if not await _acquire_job_lock("task_reminder", ttl=300):
+            return
+        pending_count = await store.get_pending_task_count()
+        if pending_count:
+            # SLACK_CHANNEL_ID accepts a comma-separated list for fan-out
+            channels = [
+                c.strip()
+                for c in os.getenv("SLACK_CHANNEL_ID", "#general").split(",")
+                if c.strip()
+            ]
+
+            pending_tasks = await store.get_pending_tasks(limit=5)
+            task_list = "\n".join([f"• {t['title']} (Priority: {t['priority']})" for t in pending_tasks])
+
             blocks = [
                 create_header_block("⏰ Pending Tasks Reminder"),
-                create_section_block(f"You have {len(pending_tasks)} pending task(s):\n\n{task_list}"),
+                create_section_block(f"You have {pending_count} pending task(s):\n\n{task_list}"),
                 create_actions_block([
                     create_button_block(
                         text="View All Tasks",
@@ -403,38 +458,110 @@ def check_pending_tasks():
                     )
                 ])
             ]
-            
-            slack_client.chat_postMessage(
-                channel=channel_id,
-                blocks=blocks,
-                text="Pending tasks reminder"
+
+            # Submit all posts concurrently, then reap results in one pass;
+            # the payload is identical per channel, so serialize it once
+            blocks_json = serialize_blocks(blocks)
+            results = await asyncio.gather(
+                *(
+                    slack_client.chat_postMessage(
+                        channel=channel,
+                        blocks=blocks_json,
+                        text="Pending tasks reminder"
+                    )
+                    for channel in channels
+                ),
+                return_exceptions=True
             )
-            logger.info(f"Sent reminder for {len(pending_tasks)} pending tasks")
+            for channel, result in zip(channels, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error posting reminder to {channel}: {result}")
+            logger.info(f"Sent reminder for {pending_count} pending tasks")
     except Exception as e:
         logger.error(f"Error checking pending tasks: {e}")
 
 
-# Schedule daily report at 9 AM
-scheduler.add_job(
-    send_daily_report,
-    trigger=CronTrigger(hour=9, minute=0),
-    id="daily_report",
-    name="Send Daily Automation Report",
-    replace_existing=True
-)
+def _init_scheduler():
+    """Build and start the scheduler; imports APScheduler on first use
+
+    Jobs persist in Redis so the schedule survives restarts and can be
+    shared between replicas without reloading everything into memory.
+    Coalescing with a misfire grace window means a paused or restarted
+    process fires each job once, not once per missed interval.
+    """
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.jobstores.redis import RedisJobStore
+    from apscheduler.triggers.cron import CronTrigger
+
+    # Forward auth as well so the jobstore interprets REDIS_URL exactly
+    # like the from_url-based client in config.py
+    redis_url = urlparse(settings.redis_url)
+    sched = AsyncIOScheduler(
+        jobstores={
+            "default": RedisJobStore(
+                host=redis_url.hostname or "localhost",
+                port=redis_url.port or 6379,
+                db=int((redis_url.path or "/0").lstrip("/") or "0"),
+                username=redis_url.username,
+                password=redis_url.password
+            )
+        }
+    )
 
-# Schedule task reminder every hour
-scheduler.add_job(
-    check_pending_tasks,
-    trigger=CronTrigger(minute=0),
-    id="task_reminder",
-    name="Check Pending Tasks",
-    replace_existing=True
-)
+    # Schedule daily report at 9 AM
+    sched.add_job(
+        send_daily_report,
+        trigger=CronTrigger(hour=9, minute=0),
+        id="daily_report",
+        name="Send Daily Automation Report",
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=600,
+        replace_existing=True
+    )
+
+    # Schedule task reminder every hour
+    sched.add_job(
+        check_pending_tasks,
+        trigger=CronTrigger(minute=0),
+        id="task_reminder",
+        name="Check Pending Tasks",
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=300,
+        replace_existing=True
+    )
+
+    sched.start()
+    return sched
 
 
 # ==================== FastAPI Routes ====================
 
+@app.on_event("startup")
+async def on_startup():
+    """Create the shared HTTP session and start the scheduler"""
+    global _http_session, scheduler
+    _http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+    )
+    slack_client.session = _http_session
+    scheduler = _init_scheduler()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Shut down the scheduler and close the shared HTTP session"""
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
+    if _http_session is not None:
+        await _http_session.close()
+
+
 @app.post("/slack/events")
 async def slack_events(request: Request):
     """Handle Slack events"""
@@ -453,16 +580,19 @@ async def root():
     return {
         "message": "Slack Automation Bot",
         "status": "running",
-        "scheduled_jobs": len(scheduler.get_jobs())
+        "scheduled_jobs": len(scheduler.get_jobs()) if scheduler is not None else 0
     }
 
 
 if __name__ == "__main__":
+    # Let libuv batch socket submissions through io_uring on Linux >= 5.6
+    os.environ.setdefault("UV_USE_IO_URING", "1")
+
     import uvicorn
     uvicorn.run(
         "app:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
         reload=True
     )
-
@@ -3,6 +3,8 @@ Slack App with Block Kit Automation - Socket Mode
 Alternative startup script using Socket Mode for easier local development
 """
 import logging
+import re
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any
 
@@ -13,17 +15,20 @@ from apscheduler.triggers.cron import CronTrigger
 from slack_sdk import WebClient
 
 from config import settings
+from models import Task, Approval, new_id
 from block_kit_components import (
     create_workflow_message,
     create_task_modal,
     create_approval_message,
-    create_dashboard_home_tab,
+    get_automation_menu_blocks_json,
+    get_dashboard_home_tab_json,
+    create_approval_result_blocks_json,
+    serialize_blocks,
     create_header_block,
     create_section_block,
     create_actions_block,
     create_button_block,
-    create_divider_block,
-    create_context_block
+    create_divider_block
 )
 
 # Configure logging
@@ -41,14 +46,58 @@ slack_client = WebClient(token=settings.slack_bot_token)
 scheduler = BackgroundScheduler()
 scheduler.start()
 
-# Store for automation data (in production, use a database)
+# Store for automation data (in production, use a database).
+# Records are slotted dataclasses; the id maps and pending-id sets let
+# lookups and the scheduler scan run on pending records only instead of
+# filtering the full lists. The deques cap memory: once full, the
+# oldest record is evicted (and dropped from the indexes) per insert.
+_STORE_MAXLEN = 10000
+
 automation_store: Dict[str, Any] = {
-    "tasks": [],
-    "workflows": [],
-    "approvals": []
+    "tasks": deque(maxlen=_STORE_MAXLEN),
+    "tasks_by_id": {},
+    "pending_task_ids": set(),
+    "workflows": deque(maxlen=_STORE_MAXLEN),
+    "approvals": deque(maxlen=_STORE_MAXLEN),
+    "approvals_by_id": {},
+    "pending_approval_ids": set()
 }
 
 
+def _store_task(task: Task):
+    """Add a task to the store, evicting the oldest if at capacity"""
+    tasks = automation_store["tasks"]
+    if len(tasks) == tasks.maxlen:
+        evicted = tasks[0]
+        automation_store["tasks_by_id"].pop(evicted.id, None)
+        automation_store["pending_task_ids"].discard(evicted.id)
+    tasks.append(task)
+    automation_store["tasks_by_id"][task.id] = task
+    automation_store["pending_task_ids"].add(task.id)
+
+
+def _now_parts():
+    """Read the clock once and return (datetime, iso string, display string)
+
+    Handlers need the current time in several formats; capturing it once
+    avoids repeated clock reads and strftime walks per invocation.
+    """
+    now = datetime.now()
+    return now, now.isoformat(), now.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _store_approval(approval: Approval):
+    """Add an approval to the store, evicting the oldest if at capacity"""
+    approvals = automation_store["approvals"]
+    if len(approvals) == approvals.maxlen:
+        evicted = approvals[0]
+        automation_store["approvals_by_id"].pop(evicted.id, None)
+        automation_store["pending_approval_ids"].discard(evicted.id)
+    approvals.append(approval)
+    automation_store["approvals_by_id"][approval.id] = approval
+    automation_store["pending_approval_ids"].add(approval.id)
+
+
 # ==================== Slack Event Handlers ====================
 # (Same handlers as app.py)
 
@@ -57,35 +106,32 @@ def handle_app_home_opened(event, client):
     """Handle app home opened event"""
     try:
         user_id = event["user"]
-        view = create_dashboard_home_tab()
-        client.views_publish(user_id=user_id, view=view)
+        client.views_publish(user_id=user_id, view=get_dashboard_home_tab_json())
         logger.info(f"Published home tab for user {user_id}")
     except Exception as e:
         logger.error(f"Error publishing home tab: {e}")
 
 
+# One left-to-right pass over the message instead of a substring scan
+# per keyword; re.I makes lowercasing the whole message unnecessary
+_CMD_RE = re.compile(r"\b(hello|hi|workflow|task|approval)\b", re.I)
+
+
 @slack_app.event("message")
 def handle_message(event, client):
     """Handle message events"""
-    # Ignore bot messages
-    if event.get("subtype") == "bot_message":
+    # Cheapest negative checks first: this fires for every message in
+    # every channel the bot is in, and nearly all of them are ignored
+    if event.get("bot_id") or event.get("subtype") == "bot_message":
+        return
+
+    text = event.get("text")
+    if not text:
         return
-    
-    text = event.get("text", "").lower()
-    channel = event["channel"]
-    
-    # Handle command messages
-    if "hello" in text or "hi" in text:
-        client.chat_postMessage(
-            channel=channel,
-            text="Hello! 👋 Use `/automation` to get started with automations."
-        )
-    elif "workflow" in text:
-        send_workflow_example(client, channel)
-    elif "task" in text:
-        send_task_example(client, channel)
-    elif "approval" in text:
-        send_approval_example(client, channel, event["user"])
+
+    match = _CMD_RE.search(text)
+    if match:
+        _CMD_TABLE[match.group(1).lower()](client, event["channel"], event)
 
 
 @slack_app.command("/automation")
@@ -95,36 +141,10 @@ def handle_automation_command(ack, body, client):
     
     user_id = body["user_id"]
     channel_id = body["channel_id"]
-    
-    blocks = [
-        create_header_block("🤖 Automation Commands"),
-        create_section_block(
-            "Available automation commands:\n\n"
-            "• *Workflow* - View workflow automation example\n"
-            "• *Task* - Create and manage tasks\n"
-            "• *Approval* - Request approvals\n"
-            "• *Schedule* - Schedule automated tasks"
-        ),
-        create_divider_block(),
-        create_actions_block([
-            create_button_block(
-                text="🔄 View Workflow",
-                action_id="view_workflow_example"
-            ),
-            create_button_block(
-                text="📝 Create Task",
-                action_id="open_task_modal"
-            ),
-            create_button_block(
-                text="📋 Request Approval",
-                action_id="request_approval"
-            )
-        ])
-    ]
-    
+
     client.chat_postMessage(
         channel=channel_id,
-        blocks=blocks,
+        blocks=get_automation_menu_blocks_json(),
         text="Automation commands"
     )
 
@@ -147,22 +167,23 @@ def handle_task_modal_submit(ack, body, client):
     user_id = body["user"]["id"]
     
     task_title = values["task_title"]["title_input"]["value"]
-    task_description = values.get("task_description", {}).get("description_input", {}).get("value", "")
+    # Slack sends "value": null for empty optional inputs, so the .get
+    # defaults never apply; coerce to "" to keep the Task fields strings
+    task_description = values.get("task_description", {}).get("description_input", {}).get("value") or ""
     task_priority = values["task_priority"]["priority_select"]["selected_option"]["value"]
-    task_due_date = values.get("task_due_date", {}).get("due_date_picker", {}).get("selected_date", "")
+    task_due_date = values.get("task_due_date", {}).get("due_date_picker", {}).get("selected_date") or ""
     
     # Store task
-    task = {
-        "id": f"task_{datetime.now().timestamp()}",
-        "title": task_title,
-        "description": task_description,
-        "priority": task_priority,
-        "due_date": task_due_date,
-        "created_by": user_id,
-        "created_at": datetime.now().isoformat(),
-        "status": "pending"
-    }
-    automation_store["tasks"].append(task)
+    task = Task(
+        id=new_id("task"),
+        title=task_title,
+        description=task_description,
+        priority=task_priority,
+        due_date=task_due_date,
+        created_by=user_id,
+        created_at=datetime.now().isoformat()
+    )
+    _store_task(task)
     
     # Send confirmation message
     blocks = [
@@ -207,29 +228,19 @@ def handle_approve(ack, body, client):
     channel_id = body["channel"]["id"]
     
     # Update approval status
-    for approval in automation_store["approvals"]:
-        if approval["id"] == request_id:
-            approval["status"] = "approved"
-            approval["approved_by"] = user_id
-            approval["approved_at"] = datetime.now().isoformat()
-            break
-    
+    _, now_iso, now_display = _now_parts()
+    approval = automation_store["approvals_by_id"].get(request_id)
+    if approval:
+        approval.status = "approved"
+        approval.approved_by = user_id
+        approval.approved_at = now_iso
+        automation_store["pending_approval_ids"].discard(request_id)
+
     # Update message
-    blocks = [
-        create_header_block("✅ Request Approved"),
-        create_section_block(f"Request `{request_id}` has been approved by <@{user_id}>"),
-        create_context_block([
-            {
-                "type": "mrkdwn",
-                "text": f"Approved at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-        ])
-    ]
-    
     client.chat_update(
         channel=channel_id,
         ts=body["message"]["ts"],
-        blocks=blocks,
+        blocks=create_approval_result_blocks_json(True, request_id, user_id, now_display),
         text="Request approved"
     )
 
@@ -243,54 +254,44 @@ def handle_reject(ack, body, client):
     channel_id = body["channel"]["id"]
     
     # Update approval status
-    for approval in automation_store["approvals"]:
-        if approval["id"] == request_id:
-            approval["status"] = "rejected"
-            approval["rejected_by"] = user_id
-            approval["rejected_at"] = datetime.now().isoformat()
-            break
-    
+    _, now_iso, now_display = _now_parts()
+    approval = automation_store["approvals_by_id"].get(request_id)
+    if approval:
+        approval.status = "rejected"
+        approval.rejected_by = user_id
+        approval.rejected_at = now_iso
+        automation_store["pending_approval_ids"].discard(request_id)
+
     # Update message
-    blocks = [
-        create_header_block("❌ Request Rejected"),
-        create_section_block(f"Request `{request_id}` has been rejected by <@{user_id}>"),
-        create_context_block([
-            {
-                "type": "mrkdwn",
-                "text": f"Rejected at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-        ])
-    ]
-    
     client.chat_update(
         channel=channel_id,
         ts=body["message"]["ts"],
-        blocks=blocks,
+        blocks=create_approval_result_blocks_json(False, request_id, user_id, now_display),
         text="Request rejected"
     )
 
 
 # ==================== Helper Functions ====================
 
-def send_workflow_example(client: WebClient, channel: str):
-    """Send workflow example message"""
-    workflow_steps = [
+# The workflow example uses fixed demo steps, so serialize it once
+_WORKFLOW_EXAMPLE_BLOCKS_JSON = serialize_blocks(create_workflow_message(
+    title="Daily Report Automation",
+    status="In Progress",
+    description="Automated daily report generation workflow",
+    steps=[
         {"name": "Data Collection", "description": "Collecting data from sources", "status": "completed"},
         {"name": "Data Processing", "description": "Processing collected data", "status": "completed"},
         {"name": "Report Generation", "description": "Generating final report", "status": "in_progress"},
         {"name": "Notification", "description": "Sending notifications", "status": "pending"}
     ]
-    
-    blocks = create_workflow_message(
-        title="Daily Report Automation",
-        status="In Progress",
-        description="Automated daily report generation workflow",
-        steps=workflow_steps
-    )
-    
+))
+
+
+def send_workflow_example(client: WebClient, channel: str):
+    """Send workflow example message"""
     client.chat_postMessage(
         channel=channel,
-        blocks=blocks,
+        blocks=_WORKFLOW_EXAMPLE_BLOCKS_JSON,
         text="Workflow status"
     )
 
@@ -319,17 +320,16 @@ def send_task_example(client: WebClient, channel: str):
 
 def send_approval_example(client: WebClient, channel: str, user_id: str):
     """Send approval request example"""
-    request_id = f"req_{datetime.now().timestamp()}"
+    request_id = new_id("req")
     
-    approval = {
-        "id": request_id,
-        "requester": user_id,
-        "type": "Budget Approval",
-        "details": "Requesting approval for Q4 marketing budget",
-        "status": "pending",
-        "created_at": datetime.now().isoformat()
-    }
-    automation_store["approvals"].append(approval)
+    approval = Approval(
+        id=request_id,
+        requester=user_id,
+        type="Budget Approval",
+        details="Requesting approval for Q4 marketing budget",
+        created_at=datetime.now().isoformat()
+    )
+    _store_approval(approval)
     
     blocks = create_approval_message(
         requester=f"<@{user_id}>",
@@ -345,6 +345,36 @@ def send_approval_example(client: WebClient, channel: str, user_id: str):
     )
 
 
+def _send_greeting(client: WebClient, channel: str, event):
+    """Send the greeting reply"""
+    client.chat_postMessage(
+        channel=channel,
+        text="Hello! 👋 Use `/automation` to get started with automations."
+    )
+
+
+def _send_workflow(client: WebClient, channel: str, event):
+    send_workflow_example(client, channel)
+
+
+def _send_task(client: WebClient, channel: str, event):
+    send_task_example(client, channel)
+
+
+def _send_approval(client: WebClient, channel: str, event):
+    send_approval_example(client, channel, event["user"])
+
+
+# Dispatch table for the keyword regex in handle_message
+_CMD_TABLE = {
+    "hello": _send_greeting,
+    "hi": _send_greeting,
+    "workflow": _send_workflow,
+    "task": _send_task,
+    "approval": _send_approval
+}
+
+
 # ==================== Scheduled Automation Tasks ====================
 
 def send_daily_report():
@@ -358,7 +388,7 @@ def send_daily_report():
             create_section_block(
                 f"*Date:* {datetime.now().strftime('%Y-%m-%d')}\n"
                 f"*Total Tasks:* {len(automation_store['tasks'])}\n"
-                f"*Pending Approvals:* {len([a for a in automation_store['approvals'] if a['status'] == 'pending'])}\n"
+                f"*Pending Approvals:* {len(automation_store['pending_approval_ids'])}\n"
                 f"*Active Workflows:* {len(automation_store['workflows'])}"
             ),
             create_divider_block(),
@@ -379,15 +409,17 @@ def check_pending_tasks():
     """Check and notify about pending tasks"""
     try:
         import os
-        pending_tasks = [t for t in automation_store["tasks"] if t["status"] == "pending"]
-        if pending_tasks:
+        pending_ids = automation_store["pending_task_ids"]
+        if pending_ids:
             channel_id = os.getenv("SLACK_CHANNEL_ID", "#general")
-            
-            task_list = "\n".join([f"• {t['title']} (Priority: {t['priority']})" for t in pending_tasks[:5]])
-            
+
+            tasks_by_id = automation_store["tasks_by_id"]
+            sample = [tasks_by_id[task_id] for task_id in list(pending_ids)[:5]]
+            task_list = "\n".join([f"• {t.title} (Priority: {t.priority})" for t in sample])
+
             blocks = [
                 create_header_block("⏰ Pending Tasks Reminder"),
-                create_section_block(f"You have {len(pending_tasks)} pending task(s):\n\n{task_list}"),
+                create_section_block(f"You have {len(pending_ids)} pending task(s):\n\n{task_list}"),
                 create_actions_block([
                     create_button_block(
                         text="View All Tasks",
@@ -401,17 +433,22 @@ def check_pending_tasks():
                 blocks=blocks,
                 text="Pending tasks reminder"
             )
-            logger.info(f"Sent reminder for {len(pending_tasks)} pending tasks")
+            logger.info(f"Sent reminder for {len(pending_ids)} pending tasks")
     except Exception as e:
         logger.error(f"Error checking pending tasks: {e}")
 
 
-# Schedule daily report at 9 AM
+# Schedule daily report at 9 AM. Coalescing with a misfire grace window
+# means a paused or restarted process fires each job once, not once per
+# missed interval.
 scheduler.add_job(
     send_daily_report,
     trigger=CronTrigger(hour=9, minute=0),
     id="daily_report",
     name="Send Daily Automation Report",
+    coalesce=True,
+    max_instances=1,
+    misfire_grace_time=600,
     replace_existing=True
 )
 
@@ -421,6 +458,9 @@ scheduler.add_job(
     trigger=CronTrigger(minute=0),
     id="task_reminder",
     name="Check Pending Tasks",
+    coalesce=True,
+    max_instances=1,
+    misfire_grace_time=300,
     replace_existing=True
 )
 
@@ -2,7 +2,20 @@
 Block Kit Components for Slack App Automation
 Contains reusable Block Kit UI components
 """
-from typing import List, Dict, Any, Optional
+import functools
+from typing import List, Dict, Any, Optional, Union
+
+import orjson
+
+
+def serialize_blocks(blocks: Union[List[Dict[str, Any]], Dict[str, Any]]) -> str:
+    """Serialize blocks (or a view) to JSON with orjson
+
+    orjson is several times faster than stdlib json on these nested
+    small-string dicts, and the Slack SDK passes string payloads
+    through without re-serializing.
+    """
+    return orjson.dumps(blocks).decode()
 
 
 def create_header_block(text: str) -> Dict[str, Any]:
@@ -64,9 +77,15 @@ def create_actions_block(buttons: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# Shared read-only divider; callers never mutate blocks, so one instance
+# serves every message instead of a fresh allocation per call.
+# (json.dumps cannot serialize MappingProxyType, so a plain dict it is.)
+_DIVIDER_BLOCK: Dict[str, Any] = {"type": "divider"}
+
+
 def create_divider_block() -> Dict[str, Any]:
     """Create a divider block"""
-    return {"type": "divider"}
+    return _DIVIDER_BLOCK
 
 
 def create_context_block(elements: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -175,26 +194,35 @@ def create_workflow_message(
     steps: List[Dict[str, str]]
 ) -> List[Dict[str, Any]]:
     """Create a workflow status message with Block Kit"""
-    blocks = [
+    return [
         create_header_block(f"🔄 {title}"),
         create_section_block(f"*Status:* {status}\n*Description:* {description}"),
         create_divider_block(),
         create_header_block("Workflow Steps")
-    ]
-    
-    for i, step in enumerate(steps, 1):
-        status_emoji = "✅" if step.get("status") == "completed" else "⏳"
-        blocks.append(
-            create_section_block(
-                f"{status_emoji} *Step {i}:* {step['name']}\n_{step.get('description', '')}_"
-            )
+    ] + [
+        create_section_block(
+            f"{'✅' if step.get('status') == 'completed' else '⏳'} "
+            f"*Step {i}:* {step['name']}\n_{step.get('description', '')}_"
         )
-    
-    return blocks
+        for i, step in enumerate(steps, 1)
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _task_modal_json() -> str:
+    """Serialize the (fully static) task modal once"""
+    return serialize_blocks(_build_task_modal())
 
 
 def create_task_modal() -> Dict[str, Any]:
     """Create a modal for task creation"""
+    # The modal is static, so deserialize the cached JSON instead of
+    # rebuilding the nested dict tree on every open
+    return orjson.loads(_task_modal_json())
+
+
+def _build_task_modal() -> Dict[str, Any]:
+    """Build the task creation modal dict"""
     return {
         "type": "modal",
         "callback_id": "create_task_modal",
@@ -295,8 +323,108 @@ def create_approval_message(
     ]
 
 
+def create_automation_menu_blocks() -> List[Dict[str, Any]]:
+    """Create the /automation command menu
+
+    The menu is static, so each call deserializes JSON built once at
+    import rather than re-running the nested builder functions.
+    """
+    return orjson.loads(_AUTOMATION_MENU_BLOCKS_JSON)
+
+
+def get_automation_menu_blocks_json() -> str:
+    """Return the /automation menu pre-serialized as JSON
+
+    The Slack SDK passes string `blocks=` values through untouched, so
+    handlers posting the static menu can skip json.dumps entirely.
+    """
+    return _AUTOMATION_MENU_BLOCKS_JSON
+
+
+def _build_automation_menu_blocks() -> List[Dict[str, Any]]:
+    """Build the /automation command menu blocks"""
+    return [
+        create_header_block("🤖 Automation Commands"),
+        create_section_block(
+            "Available automation commands:\n\n"
+            "• *Workflow* - View workflow automation example\n"
+            "• *Task* - Create and manage tasks\n"
+            "• *Approval* - Request approvals\n"
+            "• *Schedule* - Schedule automated tasks"
+        ),
+        create_divider_block(),
+        create_actions_block([
+            create_button_block(
+                text="🔄 View Workflow",
+                action_id="view_workflow_example"
+            ),
+            create_button_block(
+                text="📝 Create Task",
+                action_id="open_task_modal"
+            ),
+            create_button_block(
+                text="📋 Request Approval",
+                action_id="request_approval"
+            )
+        ])
+    ]
+
+
+_AUTOMATION_MENU_BLOCKS_JSON: str = serialize_blocks(_build_automation_menu_blocks())
+
+
+@functools.lru_cache(maxsize=1)
+def get_dashboard_home_tab_json() -> str:
+    """Return the dashboard home tab pre-serialized as JSON
+
+    views_publish sends the view as a JSON string form field anyway, so
+    a cached string skips one json.dumps per home-tab open.
+    """
+    return serialize_blocks(create_dashboard_home_tab())
+
+
+def _build_approval_result_template(header: str, verdict: str) -> str:
+    """Serialize an approve/reject result message with %s placeholders"""
+    return serialize_blocks([
+        create_header_block(header),
+        create_section_block(f"Request `%s` has been {verdict} by <@%s>"),
+        create_context_block([
+            {
+                "type": "mrkdwn",
+                "text": f"{verdict.capitalize()} at: %s"
+            }
+        ])
+    ])
+
+
+_APPROVED_RESULT_TPL = _build_approval_result_template("✅ Request Approved", "approved")
+_REJECTED_RESULT_TPL = _build_approval_result_template("❌ Request Rejected", "rejected")
+
+
+def create_approval_result_blocks_json(
+    approved: bool,
+    request_id: str,
+    user_id: str,
+    timestamp: str
+) -> str:
+    """Create the approve/reject result message, pre-serialized as JSON
+
+    Fills a template serialized once at import instead of rebuilding and
+    re-serializing three blocks per click. The substituted values are
+    Slack/server-generated ids and timestamps, so no JSON escaping is
+    needed.
+    """
+    template = _APPROVED_RESULT_TPL if approved else _REJECTED_RESULT_TPL
+    return template % (request_id, user_id, timestamp)
+
+
+@functools.lru_cache(maxsize=1)
 def create_dashboard_home_tab() -> Dict[str, Any]:
-    """Create a home tab view with dashboard"""
+    """Create a home tab view with dashboard
+
+    The dashboard is identical for every user, so the dict is built once
+    and must be treated as read-only by callers.
+    """
     return {
         "type": "home",
         "blocks": [
@@ -1,6 +1,7 @@
 import os
 from typing import Optional
 from dotenv import load_dotenv
+from redis import asyncio as aioredis
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,6 +13,7 @@ class Settings:
         self.slack_bot_token: str = os.getenv("SLACK_BOT_TOKEN", "")
         self.slack_app_token: str = os.getenv("SLACK_APP_TOKEN", "")
         self.slack_signing_secret: str = os.getenv("SLACK_SIGNING_SECRET", "")
+        self.redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self.port: int = int(os.getenv("PORT", "3000"))
         self.host: str = os.getenv("HOST", "0.0.0.0")
         
@@ -23,3 +25,6 @@ class Settings:
 
 settings = Settings()
 
+# Shared async Redis client for the automation store
+redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+
@@ -0,0 +1,45 @@
+"""
+Record types for the automation store
+Slotted dataclasses keep per-record memory at a fraction of the plain
+dicts they replace and fix the field layout of tasks and approvals.
+"""
+import secrets
+from dataclasses import dataclass
+
+
+def new_id(prefix: str) -> str:
+    """Generate a collision-safe record id
+
+    The old datetime.now().timestamp() ids could collide on fast
+    consecutive creates; a random token is cheaper to format and safe
+    under burst load.
+    """
+    return f"{prefix}_{secrets.token_urlsafe(12)}"
+
+
+@dataclass(slots=True)
+class Task:
+    """A task created from the task modal"""
+    id: str
+    title: str
+    description: str
+    priority: str
+    due_date: str
+    created_by: str
+    created_at: str
+    status: str = "pending"
+
+
+@dataclass(slots=True)
+class Approval:
+    """An approval request awaiting resolution"""
+    id: str
+    requester: str
+    type: str
+    details: str
+    created_at: str
+    status: str = "pending"
+    approved_by: str = ""
+    approved_at: str = ""
+    rejected_by: str = ""
+    rejected_at: str = ""
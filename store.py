@@ -0,0 +1,111 @@
+"""
+Redis-backed store for automation data
+Records live in one hash per task/approval plus a set per status, so
+status lookups and counts are O(1) and state is shared between workers.
+"""
+from typing import Any, Dict, List
+
+from cachetools import TTLCache
+
+from config import redis_client
+
+# Short-lived cache in front of Redis for counts that rarely change
+# between reads (dashboard and report paths re-request them often)
+_count_cache: TTLCache = TTLCache(maxsize=64, ttl=30)
+
+
+async def _cached_scard(key: str) -> int:
+    """SCARD with a short in-process TTL cache"""
+    try:
+        return _count_cache[key]
+    except KeyError:
+        count = await redis_client.scard(key)
+        _count_cache[key] = count
+        return count
+
+
+# ==================== Tasks ====================
+
+async def add_task(task: Dict[str, Any]) -> None:
+    """Store a task and index it by status"""
+    task_id = task["id"]
+    await redis_client.hset(f"task:{task_id}", mapping=task)
+    await redis_client.sadd("tasks:all", task_id)
+    await redis_client.sadd(f"tasks:{task['status']}", task_id)
+
+
+async def set_task_status(task_id: str, status: str) -> None:
+    """Move a task from pending to the given status"""
+    await redis_client.hset(f"task:{task_id}", "status", status)
+    await redis_client.smove("tasks:pending", f"tasks:{status}", task_id)
+
+
+async def get_pending_tasks(limit: int = 5) -> List[Dict[str, Any]]:
+    """Fetch up to `limit` pending tasks"""
+    task_ids = await redis_client.srandmember("tasks:pending", limit)
+    return [await redis_client.hgetall(f"task:{task_id}") for task_id in task_ids]
+
+
+async def get_task_count() -> int:
+    """Total number of stored tasks"""
+    return await _cached_scard("tasks:all")
+
+
+async def get_pending_task_count() -> int:
+    """Number of pending tasks"""
+    return await _cached_scard("tasks:pending")
+
+
+# ==================== Approvals ====================
+
+async def add_approval(approval: Dict[str, Any]) -> None:
+    """Store an approval request and index it as pending"""
+    request_id = approval["id"]
+    await redis_client.hset(f"approval:{request_id}", mapping=approval)
+    await redis_client.sadd("approvals:pending", request_id)
+
+
+# The whole approve/reject transition runs server-side in one EVALSHA:
+# atomic, and one round-trip instead of one per HSET/SMOVE.
+# register_script loads it once and reuses the cached SHA afterwards.
+_RESOLVE_APPROVAL_LUA = """
+redis.call('HSET', KEYS[1],
+           'status', ARGV[1],
+           ARGV[1] .. '_by', ARGV[2],
+           ARGV[1] .. '_at', ARGV[3])
+redis.call('SMOVE', KEYS[2], KEYS[3], ARGV[4])
+return 1
+"""
+_resolve_approval = redis_client.register_script(_RESOLVE_APPROVAL_LUA)
+
+
+async def set_approval_status(
+    request_id: str,
+    status: str,
+    user_id: str,
+    timestamp: str
+) -> None:
+    """Resolve a pending approval as approved or rejected"""
+    await _resolve_approval(
+        keys=[f"approval:{request_id}", "approvals:pending", f"approvals:{status}"],
+        args=[status, user_id, timestamp, request_id]
+    )
+
+
+async def get_pending_approval_count() -> int:
+    """Number of pending approvals"""
+    return await _cached_scard("approvals:pending")
+
+
+# ==================== Workflows ====================
+
+async def add_workflow(workflow: Dict[str, Any]) -> None:
+    """Store a workflow"""
+    workflow_id = workflow["id"]
+    await redis_client.hset(f"workflow:{workflow_id}", mapping=workflow)
+    await redis_client.sadd("workflows:all", workflow_id)
+
+
+async def get_workflow_count() -> int:
+    """Number of active workflows"""
+    return await _cached_scard("workflows:all")